@@ -0,0 +1,79 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add indexes on FAB permission tables
+
+Revision ID: 5da59742d10f
+Revises: 30867afad44a
+Create Date: 2021-06-15 10:32:47.219301
+
+"""
+
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '5da59742d10f'
+down_revision = '30867afad44a'
+branch_labels = None
+depends_on = None
+
+# (index name, table name, columns). The existing unique constraints lead with the
+# other column, so they can't serve lookups by resource or by role.
+INDEXES = [
+    ('idx_ab_perm_view_vm_perm', 'ab_permission_view', ['view_menu_id', 'permission_id']),
+    ('idx_ab_perm_view_role_role_pv', 'ab_permission_view_role', ['role_id', 'permission_view_id']),
+]
+
+
+def _skip(conn):
+    # InnoDB already indexes foreign key columns and reuses our composite indexes for the
+    # view_menu_id/role_id foreign keys, so they could not be dropped again (error 1553).
+    return conn.dialect.name == 'mysql'
+
+
+def upgrade():
+    """Apply Add indexes on FAB permission tables"""
+    conn = op.get_bind()
+    if _skip(conn):
+        return
+    inspector = Inspector.from_engine(conn)
+    tables = inspector.get_table_names()
+
+    for index_name, table_name, columns in INDEXES:
+        if table_name not in tables:
+            continue
+        if index_name in {index['name'] for index in inspector.get_indexes(table_name)}:
+            continue
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade():
+    """Unapply Add indexes on FAB permission tables"""
+    conn = op.get_bind()
+    if _skip(conn):
+        return
+    inspector = Inspector.from_engine(conn)
+    tables = inspector.get_table_names()
+
+    for index_name, table_name, _ in INDEXES:
+        if table_name not in tables:
+            continue
+        if index_name not in {index['name'] for index in inspector.get_indexes(table_name)}:
+            continue
+        op.drop_index(index_name, table_name=table_name)
@@ -17,19 +17,34 @@
 # under the License.
 #
 
+import threading
+import time
 import warnings
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
 
-from flask import current_app, g
+from flask import current_app, g, has_request_context
 from flask_appbuilder.security.sqla import models as sqla_models
 from flask_appbuilder.security.sqla.manager import SecurityManager
-from flask_appbuilder.security.sqla.models import Permission, PermissionView, Role, User, ViewMenu
-from sqlalchemy import or_
+from flask_appbuilder.security.sqla.models import (
+    Permission,
+    PermissionView,
+    Role,
+    User,
+    ViewMenu,
+    assoc_permissionview_role,
+    assoc_user_role,
+)
+from sqlalchemy import Table, and_, exists, literal, or_, select
+from sqlalchemy.dialects import mysql, postgresql
 from sqlalchemy.orm import joinedload
+from sqlalchemy.sql.expression import Insert
 
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.models import DagBag, DagModel
 from airflow.security import permissions
+from airflow.utils.helpers import chunks
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.session import provide_session
 from airflow.www.utils import CustomSQLAInterface
@@ -49,13 +64,71 @@ from airflow.www.views import (
     CustomViewMenuModelView,
 )
 
-EXISTING_ROLES = {
-    'Admin',
-    'Viewer',
-    'User',
-    'Op',
-    'Public',
-}
+EXISTING_ROLES = frozenset(
+    {
+        'Admin',
+        'Viewer',
+        'User',
+        'Op',
+        'Public',
+    }
+)
+
+# Maximum number of names bound in a single IN clause, which keeps permission lookups
+# for many DAGs below the bind parameter limits of SQLite (999) and MSSQL (2100)
+_NAME_LOOKUP_BATCH_SIZE = 500
+
+# Default roles which can access all DAGs
+_ALL_DAG_ROLES = frozenset({'Admin', 'Viewer', 'Op', 'User'})
+
+# Permissions on the global DAGs resource, which can also be satisfied by access to some DAGs
+_ALL_DAGS_PERMISSIONS = frozenset(
+    {
+        (permissions.ACTION_CAN_READ, permissions.RESOURCE_DAG),
+        (permissions.ACTION_CAN_EDIT, permissions.RESOURCE_DAG),
+    }
+)
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries also expire ``ttl`` seconds after being set"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value cached for the key, or the default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Caches the value for the key, evicting the least recently used entries if full.
+        Does nothing if the ttl isn't positive.
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries"""
+        with self._lock:
+            self._data.clear()
 
 
 class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=too-many-public-methods
@@ -144,7 +217,7 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
     ]
 
     # global resource for dag-level access
-    DAG_RESOURCES = {permissions.RESOURCE_DAG}
+    DAG_RESOURCES = frozenset({permissions.RESOURCE_DAG})
     DAG_ACTIONS = permissions.DAG_ACTIONS
 
     ###########################################################################
@@ -182,8 +255,13 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
     useroidmodelview = CustomUserOIDModelView
     userstatschartview = CustomUserStatsChartView
 
+    # Maximum number of entries of the permission caches created by `_init_perm_caches`
+    PERMISSION_CACHE_SIZE = 10000
+    ROLE_PERMISSIONS_CACHE_SIZE = 256
+
     def __init__(self, appbuilder):
         super().__init__(appbuilder)
+        self._init_perm_caches()
 
         # Go and fix up the SQLAInterface used from the stock one to our subclass.
         # This is needed to support the "hack" where we had to edit
@@ -195,7 +273,6 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
             if not view or not getattr(view, 'datamodel', None):
                 continue
             view.datamodel = CustomSQLAInterface(view.datamodel.obj)
-        self.perms = None
 
     def init_role(self, role_name, perms):
         """
@@ -211,23 +288,42 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         )
         self.bulk_sync_roles([{'role': role_name, 'perms': perms}])
 
-    def bulk_sync_roles(self, roles):
-        """Sync the provided roles and permissions."""
+    def bulk_sync_roles(self, roles, non_dag_perms=None):
+        """
+        Sync the provided roles and permissions.
+
+        :param roles: list of role configs, each a dict with a ``role`` name and its ``perms``
+        :param non_dag_perms: already loaded result of `_get_all_non_dag_permissions`, if any.
+            Permissions created while syncing are added to it.
+        :return: None.
+        """
         existing_roles = self._get_all_roles_with_permissions()
-        non_dag_perms = self._get_all_non_dag_permissions()
+        if non_dag_perms is None:
+            non_dag_perms = self._get_all_non_dag_permissions()
 
         for config in roles:
             role_name = config['role']
             perms = config['perms']
             role = existing_roles.get(role_name) or self.add_role(role_name)
+            existing_perm_ids = {perm.id for perm in role.permissions}
 
+            missing_perms = []
             for action_name, resource_name in perms:
-                perm = non_dag_perms.get((action_name, resource_name)) or self.create_permission(
-                    action_name, resource_name
-                )
+                perm = non_dag_perms.get((action_name, resource_name))
+                if not perm:
+                    perm = self.create_permission(action_name, resource_name)
+                    if perm and not resource_name.startswith(permissions.RESOURCE_DAG_PREFIX):
+                        non_dag_perms[(action_name, resource_name)] = perm
+
+                if perm and perm.id not in existing_perm_ids:
+                    missing_perms.append(perm)
+                    existing_perm_ids.add(perm.id)
+
+            # Extending the collection only emits INSERTs for the new association rows
+            role.permissions.extend(missing_perms)
 
-                if perm not in role.permissions:
-                    self.add_permission_to_role(role, perm)
+        self.get_session.commit()
+        self.invalidate_perm_cache()
 
     def add_permissions(self, role, perms):
         """Adds permissions to a given role."""
@@ -318,6 +414,7 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
             self.log.info("Deleting role '%s'", role_name)
             session.delete(role)
             session.commit()
+            self.invalidate_perm_cache()
         else:
             raise AirflowException(f"Role named '{role_name}' does not exist")
 
@@ -325,23 +422,63 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
     def get_user_roles(user=None):
         """
         Get all the roles associated with the user.
+        Within a request, the roles are cached on the request globals.
 
         :param user: the ab_user in FAB model.
         :return: a list of roles associated with the user.
         """
         if user is None:
             user = g.user
+        cache_key = f"_airflow_user_roles_{'anon' if user.is_anonymous else user.id}"
+        if has_request_context() and cache_key in g:
+            return g.get(cache_key)
+
         if user.is_anonymous:
             public_role = current_app.appbuilder.get_app.config["AUTH_ROLE_PUBLIC"]
-            return [current_app.appbuilder.sm.find_role(public_role)] if public_role else []
-        return user.roles
+            roles = [current_app.appbuilder.sm.find_role(public_role)] if public_role else []
+        else:
+            roles = list(user.roles)
+
+        if has_request_context():
+            setattr(g, cache_key, roles)
+        return roles
 
     def get_current_user_permissions(self):
         """Returns permissions for logged in user as a set of tuples with the action and resource name"""
-        perms = set()
-        for role in self.get_user_roles():
-            perms.update({(perm.permission.name, perm.view_menu.name) for perm in role.permissions})
-        return perms
+        return set(self._get_permissions_for_role_ids(self._get_user_role_ids()))
+
+    def _get_permissions_for_role_ids(
+        self, role_ids: Sequence[int], action_names: Optional[Iterable[str]] = None, session=None
+    ) -> List[Tuple[str, str]]:
+        """
+        Returns the distinct (action_name, resource_name) tuples granted to any of the given roles,
+        fetching only the names instead of loading the role and permission objects.
+
+        :param role_ids: ids of the roles to get the permissions of
+        :type role_ids: Sequence[int]
+        :param action_names: if given, only permissions for these actions are returned
+        :type action_names: Optional[Iterable[str]]
+        :param session: session to query with, defaults to the security manager's session
+        :return: list of (action_name, resource_name) tuples
+        :rtype: List[Tuple[str, str]]
+        """
+        if not role_ids:
+            return []
+        if session is None:
+            session = self.get_session
+        query = (
+            session.query(self.permissionview_model)
+            .join(self.permission_model)
+            .join(self.viewmenu_model)
+            .join(
+                assoc_permissionview_role,
+                assoc_permissionview_role.c.permission_view_id == self.permissionview_model.id,
+            )
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+        )
+        if action_names is not None:
+            query = query.filter(self.permission_model.name.in_(action_names))
+        return query.with_entities(self.permission_model.name, self.viewmenu_model.name).distinct().all()
 
     def get_readable_dags(self, user):
         """Gets the DAGs readable by authenticated user."""
@@ -370,35 +507,31 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
     def get_accessible_dags(self, user_actions, user, session=None):
         """Generic function to get readable or writable DAGs for user."""
         if user.is_anonymous:
-            roles = self.get_user_roles(user)
+            role_ids = [role.id for role in self.get_user_roles(user) if role]
         else:
-            user_query = (
-                session.query(User)
-                .options(
-                    joinedload(User.roles)
-                    .subqueryload(Role.permissions)
-                    .options(joinedload(PermissionView.permission), joinedload(PermissionView.view_menu))
+            role_ids = [
+                role_id
+                for role_id, in session.query(assoc_user_role.c.role_id).filter(
+                    assoc_user_role.c.user_id == user.id
                 )
-                .filter(User.id == user.id)
-                .first()
-            )
-            roles = user_query.roles
+            ]
 
-        resources = set()
-        for role in roles:
-            for permission in role.permissions:
-                action = permission.permission.name
-                if action not in user_actions:
-                    continue
+        resource_names = {
+            resource_name
+            for _, resource_name in self._get_permissions_for_role_ids(
+                role_ids, action_names=user_actions, session=session
+            )
+        }
 
-                resource = permission.view_menu.name
-                if resource == permissions.RESOURCE_DAG:
-                    return session.query(DagModel)
+        if permissions.RESOURCE_DAG in resource_names:
+            return session.query(DagModel)
 
-                if resource.startswith(permissions.RESOURCE_DAG_PREFIX):
-                    resources.add(resource[len(permissions.RESOURCE_DAG_PREFIX) :])
-                else:
-                    resources.add(resource)
+        resources = set()
+        for resource in resource_names:
+            if resource.startswith(permissions.RESOURCE_DAG_PREFIX):
+                resources.add(resource[len(permissions.RESOURCE_DAG_PREFIX) :])
+            else:
+                resources.add(resource)
 
         return session.query(DagModel).filter(DagModel.dag_id.in_(resources))
 
@@ -452,8 +585,16 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         Overriding the method to ensure that it always returns a bool
         _has_view_access can return NoneType which gives us
         issues later on, this fixes that.
+
+        Unless statically configured builtin roles are in use, the check is done
+        with a single EXISTS query over the (request-cached) ids of the user's roles.
         """
-        return bool(super()._has_view_access(user, action, resource))
+        if self.builtin_roles:
+            return bool(super()._has_view_access(user, action, resource))
+        role_ids = [role.id for role in self.get_user_roles(user) if role]
+        if not role_ids:
+            return False
+        return bool(self.exist_permission_on_roles(resource, action, role_ids))
 
     def has_access(self, action_name, resource_name, user=None) -> bool:
         """
@@ -475,6 +616,13 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         if user.is_anonymous:
             user.roles = self.get_user_roles(user)
 
+        # Keyed by role ids rather than user id, so that changing a user's roles takes effect at once
+        role_ids = tuple(sorted(role.id for role in self.get_user_roles(user) if role))
+        cache_key = (role_ids, action_name, resource_name)
+        has_access = self._permission_cache.get(cache_key)
+        if has_access is not None:
+            return has_access
+
         has_access = self._has_access(user, action_name, resource_name)
         # FAB built-in view access method. Won't work for AllDag access.
 
@@ -484,8 +632,26 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
             elif action_name == permissions.ACTION_CAN_EDIT:
                 has_access |= self.can_edit_dag(resource_name, user)
 
+        self._permission_cache.set(cache_key, has_access)
         return has_access
 
+    def _init_perm_caches(self) -> None:
+        """
+        Creates the caches of `has_access` and `_has_perm` results, both keyed by
+        (sorted role ids, action name, resource name).
+        Permission changes made through this security manager clear them; changes made elsewhere
+        (e.g. by another webserver process) are picked up once the entries expire after
+        ``[webserver] permission_cache_ttl`` seconds.
+        """
+        ttl = conf.getint('webserver', 'permission_cache_ttl')
+        self._permission_cache = _TTLCache(maxsize=self.PERMISSION_CACHE_SIZE, ttl=ttl)
+        self._role_permissions_cache = _TTLCache(maxsize=self.ROLE_PERMISSIONS_CACHE_SIZE, ttl=ttl)
+
+    def invalidate_perm_cache(self) -> None:
+        """Clears the cached results of `has_access` and `_has_perm`"""
+        self._permission_cache.clear()
+        self._role_permissions_cache.clear()
+
     def _has_access(self, user: User, action_name: str, resource_name: str) -> bool:
         """
         Wraps the FAB built-in view access method. Won't work for AllDag access.
@@ -501,24 +667,32 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         """
         return bool(self._has_view_access(user, action_name, resource_name))
 
-    def _get_and_cache_perms(self):
-        """Cache permissions"""
-        self.perms = self.get_current_user_permissions()
+    def _get_user_role_ids(self) -> List[int]:
+        """Returns the ids of the roles associated with the current user"""
+        return [role.id for role in self.get_user_roles() if role]
 
     def _has_role(self, role_name_or_list):
         """Whether the user has this role name"""
-        if not isinstance(role_name_or_list, list):
+        if isinstance(role_name_or_list, str):
             role_name_or_list = [role_name_or_list]
-        return any(r.name in role_name_or_list for r in self.get_user_roles())
+        if not isinstance(role_name_or_list, frozenset):
+            role_name_or_list = frozenset(role_name_or_list)
+        return not role_name_or_list.isdisjoint(r.name for r in self.get_user_roles())
 
     def _has_perm(self, action_name, resource_name):
-        """Whether the user has this perm"""
-        if hasattr(self, 'perms') and self.perms is not None:
-            if (action_name, resource_name) in self.perms:
-                return True
-        # rebuild the permissions set
-        self._get_and_cache_perms()
-        return (action_name, resource_name) in self.perms
+        """
+        Whether the user has this perm, checked with a single EXISTS query instead of
+        loading all of the user's permissions, and cached per set of role ids.
+        """
+        role_ids = tuple(sorted(self._get_user_role_ids()))
+        if not role_ids:
+            return False
+        cache_key = (role_ids, action_name, resource_name)
+        has_perm = self._role_permissions_cache.get(cache_key)
+        if has_perm is None:
+            has_perm = bool(self.exist_permission_on_roles(resource_name, action_name, list(role_ids)))
+            self._role_permissions_cache.set(cache_key, has_perm)
+        return has_perm
 
     def has_all_dags_access(self):
         """
@@ -528,7 +702,7 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         3. Has can_edit action on dags resource.
         """
         return (
-            self._has_role(['Admin', 'Viewer', 'Op', 'User'])
+            self._has_role(_ALL_DAG_ROLES)
             or self._has_perm(permissions.ACTION_CAN_READ, permissions.RESOURCE_DAG)
             or self._has_perm(permissions.ACTION_CAN_EDIT, permissions.RESOURCE_DAG)
         )
@@ -543,6 +717,11 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
                 sqla_models.PermissionView.view_menu == None,  # noqa pylint: disable=singleton-comparison
             )
         )
+        # Faulty permissions are rare, so check for any with a cheap EXISTS before
+        # loading and deleting them.
+        if not sesh.query(literal(True)).filter(perms.exists()).scalar():
+            return
+
         # Since FAB doesn't define ON DELETE CASCADE on these tables, we need
         # to delete the _object_ so that SQLA knows to delete the many-to-many
         # relationship object too. :(
@@ -585,11 +764,26 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         :return: None.
         """
         website_permission = self.create_permission(permissions.ACTION_CAN_READ, permissions.RESOURCE_WEBSITE)
-        custom_roles = [role for role in self.get_all_roles() if role.name not in EXISTING_ROLES]
-        for role in custom_roles:
-            self.add_permission_to_role(role, website_permission)
+        role_table = self.role_model.__table__
+        custom_roles_without_permission = select([literal(website_permission.id), role_table.c.id]).where(
+            and_(
+                ~role_table.c.name.in_(EXISTING_ROLES),
+                ~exists().where(
+                    and_(
+                        assoc_permissionview_role.c.permission_view_id == website_permission.id,
+                        assoc_permissionview_role.c.role_id == role_table.c.id,
+                    )
+                ),
+            )
+        )
+        self.get_session.execute(
+            self._insert_ignoring_duplicates(assoc_permissionview_role).from_select(
+                ['permission_view_id', 'role_id'], custom_roles_without_permission
+            )
+        )
 
         self.get_session.commit()
+        self.invalidate_perm_cache()
 
     def add_permission_to_role(self, role: Role, permission: PermissionView) -> None:
         """
@@ -603,6 +797,7 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         :rtype: None
         """
         self.add_permission_role(role, permission)
+        self.invalidate_perm_cache()
 
     def remove_permission_from_role(self, role: Role, permission: PermissionView) -> None:
         """
@@ -614,6 +809,7 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         :type permission: PermissionView
         """
         self.del_permission_role(role, permission)
+        self.invalidate_perm_cache()
 
     def delete_action(self, name: str) -> bool:
         """
@@ -674,46 +870,125 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
 
         :return: None.
         """
-        perms = self.get_all_permissions()
         dagbag = DagBag(read_dags_from_db=True)
         dagbag.collect_dags_from_db()
         dags = dagbag.dags.values()
 
-        for dag in dags:
-            dag_resource_name = permissions.resource_name_for_dag(dag.dag_id)
-            for action_name in self.DAG_ACTIONS:
-                if (action_name, dag_resource_name) not in perms:
-                    self._merge_perm(action_name, dag_resource_name)
+        self.sync_perms_for_dags(dag.dag_id for dag in dags)
 
+        for dag in dags:
             if dag.access_control:
+                dag_resource_name = permissions.resource_name_for_dag(dag.dag_id)
                 self.sync_perm_for_dag(dag_resource_name, dag.access_control)
 
-    def update_admin_permission(self):
+    def _insert_ignoring_duplicates(self, table: Table) -> Insert:
+        """
+        Returns an INSERT statement for the given table which silently skips rows
+        violating one of its unique constraints, so that concurrent syncs don't fail.
+        Falls back to a plain INSERT on databases without such a syntax.
+
+        :param table: table to insert into
+        :type table: Table
+        :return: the INSERT statement
+        :rtype: Insert
+        """
+        dialect_name = self.get_session.bind.dialect.name
+        if dialect_name == 'postgresql':
+            return postgresql.insert(table).on_conflict_do_nothing()
+        if dialect_name == 'mysql':
+            # Unlike INSERT IGNORE, this doesn't also turn other errors (e.g. truncation) into warnings
+            return mysql.insert(table).on_duplicate_key_update(id=table.c.id)
+        if dialect_name == 'sqlite':
+            return table.insert().prefix_with('OR IGNORE')
+        return table.insert()
+
+    def _bulk_create_permissions(self, perms: Set[Tuple[str, str]]) -> None:
+        """
+        Creates the given permissions, along with any actions and resources they
+        reference that don't exist yet, looking names up in batches of
+        `_NAME_LOOKUP_BATCH_SIZE` rather than one query per name.
+        Unlike `create_permission`, this does not check whether the permissions
+        already exist, so callers should only pass missing ones. Permissions whose
+        names collide with a differently spelled existing name under the database
+        collation are skipped with a warning.
+
+        :param perms: set of (action_name, resource_name) pairs to create
+        :type perms: Set[Tuple[str, str]]
+        :return: None.
+        """
+        if not perms:
+            return
+
+        session = self.get_session
+
+        def _get_ids(model, names: Set[str]) -> Dict[str, int]:
+            ids = {}
+            for names_batch in chunks(sorted(names), _NAME_LOOKUP_BATCH_SIZE):
+                ids.update(session.query(model.name, model.id).filter(model.name.in_(names_batch)).all())
+            return ids
+
+        def _get_or_create_ids(model, names: Set[str]) -> Dict[str, int]:
+            ids = _get_ids(model, names)
+            missing_names = names - ids.keys()
+            if missing_names:
+                session.execute(
+                    self._insert_ignoring_duplicates(model.__table__),
+                    [{'name': name} for name in missing_names],
+                )
+                ids.update(_get_ids(model, missing_names))
+            return ids
+
+        action_ids = _get_or_create_ids(self.permission_model, {action_name for action_name, _ in perms})
+        resource_ids = _get_or_create_ids(self.viewmenu_model, {resource_name for _, resource_name in perms})
+
+        # Names that only match an existing row case- or trailing-space-insensitively (e.g. under
+        # MySQL's default collation) come back spelled differently, so they can't be resolved.
+        unresolved_perms = {
+            (action_name, resource_name)
+            for action_name, resource_name in perms
+            if action_name not in action_ids or resource_name not in resource_ids
+        }
+        if unresolved_perms:
+            self.log.warning(
+                "Skipping %s permissions whose action or resource name collides with an existing, "
+                "differently spelled one: %s",
+                len(unresolved_perms),
+                sorted(unresolved_perms),
+            )
+            perms = perms - unresolved_perms
+            if not perms:
+                session.commit()
+                return
+
+        self.log.info("Creating %s new permissions", len(perms))
+        session.execute(
+            self._insert_ignoring_duplicates(self.permissionview_model.__table__),
+            [
+                {'permission_id': action_ids[action_name], 'view_menu_id': resource_ids[resource_name]}
+                for action_name, resource_name in perms
+            ],
+        )
+        session.commit()
+
+    def update_admin_permission(self, non_dag_perms=None):
         """
         Admin should have all the permissions, except the dag permissions.
         because Admin already has Dags permission.
         Add the missing ones to the table for admin.
 
+        :param non_dag_perms: already loaded result of `_get_all_non_dag_permissions`, if any.
         :return: None.
         """
-        dag_resources = (
-            self.get_session.query(sqla_models.ViewMenu)
-            .filter(sqla_models.ViewMenu.name.like(f"{permissions.RESOURCE_DAG_PREFIX}%"))
-            .all()
-        )
-        resource_ids = [resource.id for resource in dag_resources]
-        perms = (
-            self.get_session.query(sqla_models.PermissionView)
-            .filter(~sqla_models.PermissionView.view_menu_id.in_(resource_ids))
-            .all()
-        )
-
-        perms = [p for p in perms if p.permission and p.view_menu]
+        if non_dag_perms is None:
+            non_dag_perms = self._get_all_non_dag_permissions()
+        perms = non_dag_perms.values()
 
         admin = self.find_role('Admin')
-        admin.permissions = list(set(admin.permissions) | set(perms))
+        existing_perm_ids = {perm.id for perm in admin.permissions}
+        admin.permissions.extend(perm for perm in perms if perm.id not in existing_perm_ids)
 
         self.get_session.commit()
+        self.invalidate_perm_cache()
 
     def sync_roles(self):
         """
@@ -726,12 +1001,15 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         # Create global all-dag permissions
         self.create_perm_vm_for_all_dag()
 
+        # Loaded once and shared by the default role and Admin permission syncs below
+        non_dag_perms = self._get_all_non_dag_permissions()
+
         # Sync the default roles (Admin, Viewer, User, Op, public) with related permissions
-        self.bulk_sync_roles(self.ROLE_CONFIGS)
+        self.bulk_sync_roles(self.ROLE_CONFIGS, non_dag_perms=non_dag_perms)
 
         self.add_homepage_access_to_custom_roles()
         # init existing roles, the rest role could be created through UI.
-        self.update_admin_permission()
+        self.update_admin_permission(non_dag_perms=non_dag_perms)
         self.clean_perms()
 
     def sync_resource_permissions(self, perms=None):
@@ -757,12 +1035,58 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
         :return:
         """
         dag_resource_name = permissions.resource_name_for_dag(dag_id)
-        for dag_action_name in self.DAG_ACTIONS:
-            self.create_permission(dag_action_name, dag_resource_name)
+        self.sync_perms_for_dags([dag_id])
 
         if access_control:
             self._sync_dag_view_permissions(dag_resource_name, access_control)
 
+    def sync_perms_for_dags(self, dag_ids: Iterable[str]) -> None:
+        """
+        Creates the DAG-level permissions for all given dag ids that don't have them yet.
+        Unlike `sync_perm_for_dag`, this doesn't apply any `access_control`, but it only
+        needs a constant number of queries regardless of how many DAGs are passed.
+
+        :param dag_ids: the IDs of the DAGs whose permissions should be created
+        :type dag_ids: Iterable[str]
+        :return: None.
+        """
+        dag_perms = {
+            (action_name, permissions.resource_name_for_dag(dag_id))
+            for dag_id in dag_ids
+            for action_name in self.DAG_ACTIONS
+        }
+        self._create_missing_permissions(dag_perms)
+
+    def _create_missing_permissions(self, perms: Set[Tuple[str, str]]) -> None:
+        """
+        Creates those of the given permissions that don't exist yet. When all of them
+        already exist, only one query per batch of `_NAME_LOOKUP_BATCH_SIZE` resource
+        names is needed.
+
+        :param perms: set of (action_name, resource_name) pairs
+        :type perms: Set[Tuple[str, str]]
+        :return: None.
+        """
+        if not perms:
+            return
+
+        action_names = {action_name for action_name, _ in perms}
+        resource_names = sorted({resource_name for _, resource_name in perms})
+        existing_perms = set()
+        for resource_names_batch in chunks(resource_names, _NAME_LOOKUP_BATCH_SIZE):
+            existing_perms.update(
+                self.get_session.query(self.permissionview_model)
+                .join(self.permission_model)
+                .join(self.viewmenu_model)
+                .filter(
+                    self.permission_model.name.in_(action_names),
+                    self.viewmenu_model.name.in_(resource_names_batch),
+                )
+                .with_entities(self.permission_model.name, self.viewmenu_model.name)
+                .all()
+            )
+        self._bulk_create_permissions(perms - existing_perms)
+
     def get_resource_permissions(self, resource: ViewMenu) -> PermissionView:
         """
         Retrieve permission pairs associated with a specific resource object.
@@ -795,7 +1119,12 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
             return perm
 
         def _revoke_stale_permissions(resource: ViewMenu):
-            existing_dag_perms = self.get_resource_permissions(resource)
+            existing_dag_perms = (
+                self.get_session.query(PermissionView)
+                .options(joinedload(PermissionView.permission), joinedload(PermissionView.role))
+                .filter(PermissionView.view_menu_id == resource.id)
+                .all()
+            )
             for perm in existing_dag_perms:
                 non_admin_roles = [role for role in perm.role if role.name != 'Admin']
                 for role in non_admin_roles:
@@ -827,7 +1156,7 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
                 raise AirflowException(
                     "The access_control map for DAG '{}' includes the following "
                     "invalid permissions: {}; The set of valid permissions "
-                    "is: {}".format(dag_resource_name, invalid_action_names, self.DAG_ACTIONS)
+                    "is: {}".format(dag_resource_name, invalid_action_names, sorted(self.DAG_ACTIONS))
                 )
 
             for action_name in action_names:
@@ -848,9 +1177,13 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
     def create_perm_vm_for_all_dag(self):
         """Create perm-vm if not exist and insert into FAB security model for all-dags."""
         # create perm for global logical dag
-        for resource_name in self.DAG_RESOURCES:
-            for action_name in self.DAG_ACTIONS:
-                self._merge_perm(action_name, resource_name)
+        self._create_missing_permissions(
+            {
+                (action_name, resource_name)
+                for resource_name in self.DAG_RESOURCES
+                for action_name in self.DAG_ACTIONS
+            }
+        )
 
     def check_authorization(
         self, perms: Optional[Sequence[Tuple[str, str]]] = None, dag_id: Optional[str] = None
@@ -860,10 +1193,7 @@ class AirflowSecurityManager(SecurityManager, LoggingMixin):  # pylint: disable=
             return True
 
         for perm in perms:
-            if perm in (
-                (permissions.ACTION_CAN_READ, permissions.RESOURCE_DAG),
-                (permissions.ACTION_CAN_EDIT, permissions.RESOURCE_DAG),
-            ):
+            if perm in _ALL_DAGS_PERMISSIONS:
                 can_access_all_dags = self.has_access(*perm)
                 if can_access_all_dags:
                     continue
@@ -903,6 +1233,7 @@ class ApplessAirflowSecurityManager(AirflowSecurityManager):
 
     def __init__(self, session=None):  # pylint: disable=super-init-not-called
         self.session = session
+        self._init_perm_caches()
 
     @property
     def get_session(self):
@@ -2666,8 +2666,10 @@ class Airflow(AirflowBaseView):  # noqa: D101  pylint: disable=too-many-public-m
         current_app.dag_bag.collect_dags_from_db()
 
         # sync permissions for all dags
+        current_app.appbuilder.sm.sync_perms_for_dags(current_app.dag_bag.dags.keys())
         for dag_id, dag in current_app.dag_bag.dags.items():
-            current_app.appbuilder.sm.sync_perm_for_dag(dag_id, dag.access_control)
+            if dag.access_control:
+                current_app.appbuilder.sm.sync_perm_for_dag(dag_id, dag.access_control)
         flash("All DAGs are now up to date")
         return redirect(url_for('Airflow.index'))
 
@@ -4192,6 +4194,28 @@ class DagDependenciesView(AirflowBaseView):
         }
 
 
+class PermissionCacheInvalidationMixin:
+    """
+    Clears the security manager's cached permission checks after a role or user
+    is added, updated or deleted through the view.
+    """
+
+    def post_add(self, item):
+        """Invalidate the permission cache after add"""
+        super().post_add(item)
+        current_app.appbuilder.sm.invalidate_perm_cache()
+
+    def post_update(self, item):
+        """Invalidate the permission cache after update"""
+        super().post_update(item)
+        current_app.appbuilder.sm.invalidate_perm_cache()
+
+    def post_delete(self, item):
+        """Invalidate the permission cache after delete"""
+        super().post_delete(item)
+        current_app.appbuilder.sm.invalidate_perm_cache()
+
+
 class CustomPermissionModelView(PermissionModelView):
     """Customize permission names for FAB's builtin PermissionModelView."""
 
@@ -4239,7 +4263,7 @@ class CustomResetPasswordView(ResetPasswordView):
     base_permissions = [permissions.ACTION_CAN_EDIT, permissions.ACTION_CAN_READ]
 
 
-class CustomRoleModelView(RoleModelView):
+class CustomRoleModelView(PermissionCacheInvalidationMixin, RoleModelView):
     """Customize permission names for FAB's builtin RoleModelView."""
 
     class_permission_name = permissions.RESOURCE_ROLE
@@ -4272,7 +4296,7 @@ class CustomViewMenuModelView(ViewMenuModelView):
     ]
 
 
-class CustomUserDBModelView(UserDBModelView):
+class CustomUserDBModelView(PermissionCacheInvalidationMixin, UserDBModelView):
     """Customize permission names for FAB's builtin UserDBModelView."""
 
     _class_permission_name = permissions.RESOURCE_USER
@@ -4346,7 +4370,7 @@ class CustomUserStatsChartView(UserStatsChartView):
     base_permissions = [permissions.ACTION_CAN_READ]
 
 
-class CustomUserLDAPModelView(UserLDAPModelView):
+class CustomUserLDAPModelView(PermissionCacheInvalidationMixin, UserLDAPModelView):
     """Customize permission names for FAB's builtin UserLDAPModelView."""
 
     class_permission_name = permissions.RESOURCE_MY_PROFILE
@@ -4359,7 +4383,7 @@ class CustomUserLDAPModelView(UserLDAPModelView):
     ]
 
 
-class CustomUserOAuthModelView(UserOAuthModelView):
+class CustomUserOAuthModelView(PermissionCacheInvalidationMixin, UserOAuthModelView):
     """Customize permission names for FAB's builtin UserOAuthModelView."""
 
     class_permission_name = permissions.RESOURCE_MY_PROFILE
@@ -4372,7 +4396,7 @@ class CustomUserOAuthModelView(UserOAuthModelView):
     ]
 
 
-class CustomUserOIDModelView(UserOIDModelView):
+class CustomUserOIDModelView(PermissionCacheInvalidationMixin, UserOIDModelView):
     """Customize permission names for FAB's builtin UserOIDModelView."""
 
     class_permission_name = permissions.RESOURCE_MY_PROFILE
@@ -4385,7 +4409,7 @@ class CustomUserOIDModelView(UserOIDModelView):
     ]
 
 
-class CustomUserRemoteUserModelView(UserRemoteUserModelView):
+class CustomUserRemoteUserModelView(PermissionCacheInvalidationMixin, UserRemoteUserModelView):
     """Customize permission names for FAB's builtin UserRemoteUserModelView."""
 
     class_permission_name = permissions.RESOURCE_MY_PROFILE